@@ -9,12 +9,13 @@ import asyncio
 import logging
 from datetime import datetime as dt
 from http import HTTPMethod
-from typing import TYPE_CHECKING, NoReturn
+from types import TracebackType
+from typing import TYPE_CHECKING, NoReturn, Self
 
 import aiohttp
 
 from . import exceptions as exc
-from .broker import Broker, _LocnDataT, _SessionIdT, _UserDataT, _UserInfoT
+from .broker import Broker, _LocnDataT, _SessionIdT, _UserDataT, _UserIdT, _UserInfoT
 from .schema import (
     SZ_ALLOWED_MODES,
     SZ_AUTO,
@@ -69,6 +70,14 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__.rpartition(".")[0])
 
 
+def _dt_to_api(value: dt) -> str:
+    """Return a datetime as used by the vendor's API, e.g. "2024-07-10T12:00:00Z".
+
+    The same as value.strftime("%Y-%m-%dT%H:%M:%SZ"), but without parsing a format.
+    """
+    return value.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+
+
 class EvohomeClientDeprecated:
     """Deprecated attributes and methods removed from the evohome-client namespace."""
 
@@ -196,14 +205,21 @@ class EvohomeClient(EvohomeClientDeprecated):
         /,
         *,
         session_id: _SessionIdT | None = None,
+        user_id: _UserIdT | None = None,
         session: aiohttp.ClientSession | None = None,
         hostname: str | None = None,  # is a URL
         debug: bool = False,
     ) -> None:
         """Construct the v1 EvohomeClient object.
 
-        If a session_id is provided it will be used to avoid calling the
-        authentication service, which is known to be rate limited.
+        If a session_id (and the user_id it belongs to) is provided it will be used to
+        avoid calling the authentication service, which is known to be rate limited.
+        Both are available from the broker (e.g. to persist between runs). If the
+        session has since expired, the client will re-authenticate.
+
+        If a session is not provided, one is instantiated when first needed and is
+        reused for all requests; use `async with EvohomeClient(...) as evo:`, or call
+        evo.close(), to close it.
         """
         if debug:
             _LOGGER.setLevel(logging.DEBUG)
@@ -215,16 +231,37 @@ class EvohomeClient(EvohomeClientDeprecated):
 
         self.devices: dict[_ZoneIdT, _DeviceDictT] = {}  # dhw or zone by id
         self.named_devices: dict[_ZoneNameT, _DeviceDictT] = {}  # zone by name
+        self._dhw: _DeviceDictT | None = None
+
+        # concurrent callers share a single GET of the location data
+        self._locn_data_lock = asyncio.Lock()
+        self._locn_data_refreshes = 0  # a count, rather than a (wall clock) time
 
         self.broker = Broker(
             username,
             password,
             _LOGGER,
             session_id=session_id,
+            user_id=user_id,
             hostname=hostname,
             session=session,
         )
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the client session, unless it was provided by the caller."""
+        await self.broker.close()
+
     @property
     def user_data(self) -> _UserDataT | None:  # TODO: deprecate?
         """Return the user data used for HTTP authentication."""
@@ -265,17 +302,36 @@ class EvohomeClient(EvohomeClientDeprecated):
     async def _populate_locn_data(self, force_refresh: bool = True) -> _LocnDataT:
         """Retrieve the latest system data.
 
-        Pull the latest JSON from the web unless force_refresh is False.
+        Pull the latest JSON from the web unless force_refresh is False. If another
+        caller is already doing so, wait for (and use) its result instead.
         """
 
-        if not self.location_data or force_refresh:
+        refreshes = self._locn_data_refreshes
+
+        async with self._locn_data_lock:
+            if self.location_data and not force_refresh:
+                return self.location_data
+
+            # was it refreshed by another caller while waiting for the lock?
+            if self._locn_data_refreshes != refreshes:
+                return self.location_data
+
             full_data = await self.broker.populate_full_data()
             self.location_data = full_data[self._LOC_IDX]
+            self._locn_data_refreshes += 1
 
             self.location_id = self.location_data[SZ_LOCATION_ID]
 
             self.devices = {d[SZ_DEVICE_ID]: d for d in self.location_data[SZ_DEVICES]}
             self.named_devices = {d[SZ_NAME]: d for d in self.location_data[SZ_DEVICES]}
+            self._dhw = next(
+                (
+                    d
+                    for d in self.location_data[SZ_DEVICES]
+                    if d[SZ_THERMOSTAT_MODEL_TYPE] == SZ_DOMESTIC_HOT_WATER
+                ),
+                None,
+            )
 
         return self.location_data
 
@@ -293,12 +349,13 @@ class EvohomeClient(EvohomeClientDeprecated):
 
         try:
             for device in self.location_data[SZ_DEVICES]:
-                temp = float(device[SZ_THERMOSTAT][SZ_INDOOR_TEMPERATURE])
-                values = device[SZ_THERMOSTAT][SZ_CHANGEABLE_VALUES]
+                thermostat = device[SZ_THERMOSTAT]
+                temp = float(thermostat[SZ_INDOOR_TEMPERATURE])
+                values = thermostat[SZ_CHANGEABLE_VALUES]
 
-                if SZ_HEAT_SETPOINT in values:
-                    set_point = float(values[SZ_HEAT_SETPOINT][SZ_VALUE])
-                    status = values[SZ_HEAT_SETPOINT][SZ_STATUS]
+                if (heat_setpoint := values.get(SZ_HEAT_SETPOINT)) is not None:
+                    set_point = float(heat_setpoint[SZ_VALUE])
+                    status = heat_setpoint[SZ_STATUS]
                 else:
                     set_point = 0
                     status = values[SZ_STATUS]
@@ -316,7 +373,7 @@ class EvohomeClient(EvohomeClientDeprecated):
                 )
 
         # harden code against unexpected schema (JSON structure)
-        except (LookupError, TypeError, ValueError) as err:
+        except (AttributeError, LookupError, TypeError, ValueError) as err:
             raise exc.InvalidSchema(str(err)) from err
         return result
 
@@ -334,7 +391,7 @@ class EvohomeClient(EvohomeClientDeprecated):
 
         data = {SZ_QUICK_ACTION: status}
         if until:
-            data |= {SZ_QUICK_ACTION_NEXT_TIME: until.strftime("%Y-%m-%dT%H:%M:%SZ")}
+            data |= {SZ_QUICK_ACTION_NEXT_TIME: _dt_to_api(until)}
 
         url = f"evoTouchSystems?locationId={self.location_id}"
         await self.broker.make_request(HTTPMethod.PUT, url, data=data)
@@ -418,7 +475,7 @@ class EvohomeClient(EvohomeClientDeprecated):
             data = {
                 SZ_STATUS: status,
                 SZ_VALUE: value,
-                SZ_NEXT_TIME: next_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                SZ_NEXT_TIME: _dt_to_api(next_time),
             }
 
         url = f"devices/{zone_id}/thermostat/changeableValues/heatSetpoint"
@@ -451,12 +508,9 @@ class EvohomeClient(EvohomeClientDeprecated):
         # just want id, so retrieve the config data only if we don't already have it
         await self._populate_locn_data(force_refresh=False)
 
-        for device in self.location_data[SZ_DEVICES]:
-            if device[SZ_THERMOSTAT_MODEL_TYPE] == SZ_DOMESTIC_HOT_WATER:
-                ret: _DeviceDictT = device
-                return ret
-
-        raise exc.InvalidSchema(f"No DHW in location {self.location_id}")
+        if self._dhw is None:
+            raise exc.InvalidSchema(f"No DHW in location {self.location_id}")
+        return self._dhw
 
     async def _set_dhw(
         self,
@@ -477,7 +531,7 @@ class EvohomeClient(EvohomeClientDeprecated):
             # SZ_COOL_SETPOINT: None,
         }
         if next_time:
-            data |= {SZ_NEXT_TIME: next_time.strftime("%Y-%m-%dT%H:%M:%SZ")}
+            data |= {SZ_NEXT_TIME: _dt_to_api(next_time)}
 
         url = f"devices/{dhw_id}/thermostat/changeableValues"
         await self.broker.make_request(HTTPMethod.PUT, url, data=data)
@@ -5,7 +5,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from collections.abc import Callable
 from datetime import datetime as dt
 from http import HTTPMethod, HTTPStatus
 from typing import Any, Final, TypeAlias
@@ -15,6 +18,11 @@ import aiohttp
 from . import exceptions as exc
 from .schema import SZ_SESSION_ID, SZ_USER_ID, SZ_USER_INFO
 
+try:  # NOTE: not from evohomeasync2.helpers, so as not to import evohomeasync2
+    import orjson
+except ModuleNotFoundError:  # orjson is optional, it is merely faster
+    orjson = None  # type: ignore[assignment]
+
 _SessionIdT: TypeAlias = str
 _UserIdT: TypeAlias = int
 
@@ -31,6 +39,25 @@ _APP_ID = "91db1612-73fd-4500-91b2-e63b069b185c"
 
 _LOGGER = logging.getLogger(__name__)
 
+# applies per request, so also when the session was provided by the caller
+_TIMEOUT: Final = aiohttp.ClientTimeout(total=30, sock_connect=5)
+
+# only (idempotent) GETs are retried, and only after transient errors
+_RETRY_LIMIT: Final = 2
+_RETRY_DELAY: Final = 0.5  # seconds, doubled for each retry
+_RETRY_STATUSES: Final = (
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+)
+_RETRY_ERRORS: Final = (  # i.e. not InvalidURL, TooManyRedirects, etc.
+    aiohttp.ClientConnectionError,
+    TimeoutError,
+)
+
+_json_dumps: Callable[[Any], bytes | str] = orjson.dumps if orjson else json.dumps
+_json_loads: Callable[[bytes | str], Any] = orjson.loads if orjson else json.loads
+
 
 class Broker:
     """Provide a client to access the Honeywell TCC API (assumes a single TCS)."""
@@ -46,6 +73,7 @@ class Broker:
         /,
         *,
         session_id: _SessionIdT | None = None,
+        user_id: _UserIdT | None = None,
         hostname: str | None = None,  # is a URL
         session: aiohttp.ClientSession | None = None,
     ) -> None:
@@ -55,30 +83,59 @@ class Broker:
         self._logger = logger
 
         self._session_id: _SessionIdT | None = session_id
-        self._user_id: _UserIdT | None = None
+        self._user_id: _UserIdT | None = user_id if session_id else None
 
         self.hostname: Final = hostname or URL_HOST
-        self._session = session or aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
+
+        # if not provided, a session is instantiated when first needed
+        self._session = session
+        self._session_is_owned = session is None  # if so, is closed by .close()
 
         self._headers: dict[str, str] = {
             "content-type": "application/json"
-        }  # NB: no sessionId yet
-        self._POST_DATA: Final[dict[str, str]] = {
-            "Username": self.username,
-            "Password": password,
-            "ApplicationId": _APP_ID,
-        }
+        }  # NB: no sessionId yet, unless one was provided (see below)
+        if self._user_id:  # is usable only with a user_id (e.g. from a previous run)
+            self._headers[SZ_SESSION_ID] = session_id  # type: ignore[assignment]
+        self._POST_DATA: Final[bytes | str] = _json_dumps(  # serialized only once
+            {
+                "Username": self.username,
+                "Password": password,
+                "ApplicationId": _APP_ID,
+            }
+        )
 
         self._user_data = {}
         self._full_data = []
 
+    async def close(self) -> None:
+        """Close the session, but only if it was instantiated by the broker."""
+
+        if self._session_is_owned and self._session:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session, instantiating one if required.
+
+        A single session (and its pool of keep-alive connections) is used for all
+        requests. It can't be instantiated in __init__() as a running event loop is
+        required.
+        """
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=_TIMEOUT)
+        return self._session
+
     @property
     def session_id(self) -> _SessionIdT | None:
         """Return the session id used for HTTP authentication."""
         return self._session_id
 
+    @property
+    def user_id(self) -> _UserIdT | None:
+        """Return the user id (needed, with the session id, to skip authentication)."""
+        return self._user_id
+
     async def populate_user_data(self) -> _UserDataT:
         """Return the latest user data as retrieved from the web."""
 
@@ -93,7 +150,7 @@ class Broker:
         url = "session"
         response = await self.make_request(HTTPMethod.POST, url, data=self._POST_DATA)
 
-        self._user_data: _UserDataT = await response.json()
+        self._user_data: _UserDataT = await response.json(loads=_json_loads)
 
         user_id: _UserIdT = self._user_data[SZ_USER_INFO][SZ_USER_ID]  # type: ignore[assignment,index]
         session_id: _SessionIdT = self._user_data[SZ_SESSION_ID]  # type: ignore[assignment]
@@ -102,7 +159,7 @@ class Broker:
         self._session_id = self._headers[SZ_SESSION_ID] = session_id
         self._session_renewed = dt.now()
 
-        self._logger.info(f"user_data = {self._user_data}")
+        self._logger.info("user_data = %s", self._user_data)
         return self._user_data, response
 
     async def populate_full_data(self) -> list[_LocnDataT]:
@@ -113,11 +170,11 @@ class Broker:
             await self.populate_user_data()
 
         url = f"locations?userId={self._user_id}&allData=True"
-        response = await self.make_request(HTTPMethod.GET, url, data=self._POST_DATA)
+        response = await self.make_request(HTTPMethod.GET, url)  # NOTE: no body
 
-        self._full_data: list[_LocnDataT] = await response.json()
+        self._full_data: list[_LocnDataT] = await response.json(loads=_json_loads)
 
-        self._logger.info(f"full_data = {self._full_data}")
+        self._logger.info("full_data = %s", self._full_data)
         return self._full_data
 
     async def _make_request(
@@ -126,34 +183,46 @@ class Broker:
         url: str,
         /,
         *,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | str | None = None,  # str/bytes is JSON
         _dont_reauthenticate: bool = False,  # used only with recursive call
     ) -> aiohttp.ClientResponse:
         """Perform an HTTP request, with an optional retry if re-authenticated."""
 
         response: aiohttp.ClientResponse
 
+        session = self._get_session()
+
         if method == HTTPMethod.GET:
-            func = self._session.get
+            func = session.get
         elif method == HTTPMethod.PUT:
-            func = self._session.put
+            func = session.put
         elif method == HTTPMethod.POST:
-            func = self._session.post
+            func = session.post
 
         url_ = self.hostname + "/WebAPI/api/" + url
 
-        async with func(url_, json=data, headers=self._headers) as response:
-            response_text = await response.text()  # why cant I move this below the if?
+        # NOTE: the headers include the Content-Type, so the body can be pre-serialized
+        if data is None or isinstance(data, bytes | str):
+            body = data
+        else:
+            body = _json_dumps(data)
+
+        async with func(
+            url_, data=body, headers=self._headers, timeout=_TIMEOUT
+        ) as response:
+            # the body must be read (buffered) before the connection is released, but
+            # needn't be decoded (callers use .json(), which will use the buffer)
+            response_body = await response.read()
 
             # if 401/unauthorized, may need to refresh sessionId (expires in 15 mins?)
             if response.status != HTTPStatus.UNAUTHORIZED or _dont_reauthenticate:
                 return response
 
             # TODO: use response.content_type to determine whether to use .json()
-            if "code" not in response_text:  # don't use .json() yet: may be plain text
+            if b"code" not in response_body:  # don't use .json() yet: may be plain text
                 return response
 
-            response_json = await response.json()
+            response_json = await response.json(loads=_json_loads)
             if response_json[0]["code"] != "Unauthorized":
                 return response
 
@@ -184,30 +253,47 @@ class Broker:
         url: str,
         /,
         *,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | str | None = None,  # str/bytes is JSON
     ) -> aiohttp.ClientResponse:
-        """Perform an HTTP request, will authenticate if required."""
-
-        try:
-            response = await self._make_request(method, url, data=data)  # ? ClientError
-            response.raise_for_status()  # ? ClientResponseError
-
-        # response.method, response.url, response.status, response._body
-        # POST,    /session, 429, [{code: TooManyRequests, message: Request count limitation exceeded...}]
-        # GET/PUT  /???????, 401, [{code: Unauthorized,    message: Unauthorized}]
-
-        except aiohttp.ClientResponseError as err:
-            if response.method == HTTPMethod.POST:  # POST only used when authenticating
-                raise exc.AuthenticationFailed(  # includes TOO_MANY_REQUESTS
-                    str(err), status=err.status
-                ) from err
-            if response.status == HTTPStatus.TOO_MANY_REQUESTS:
-                raise exc.RateLimitExceeded(str(err), status=err.status) from err
-            raise exc.RequestFailed(str(err), status=err.status) from err
-
-        except aiohttp.ClientError as err:  # using response causes UnboundLocalError
-            if method == HTTPMethod.POST:  # POST only used when authenticating
-                raise exc.AuthenticationFailed(str(err)) from err
-            raise exc.RequestFailed(str(err)) from err
-
-        return response
+        """Perform an HTTP request, will authenticate if required.
+
+        A GET is retried (a bounded number of times, with a backoff) after a transient
+        error, such as a timeout or a 503. A 429 (rate limit exceeded) is not retried.
+        """
+
+        retries = _RETRY_LIMIT if method == HTTPMethod.GET else 0
+
+        for attempt in range(retries + 1):
+            try:
+                response = await self._make_request(method, url, data=data)
+                response.raise_for_status()  # ? ClientResponseError
+
+            # response.method, response.url, response.status, response._body
+            # POST,    /session, 429, [{code: TooManyRequests, message: Request count limitation exceeded...}]
+            # GET/PUT  /???????, 401, [{code: Unauthorized,    message: Unauthorized}]
+
+            except aiohttp.ClientResponseError as err:
+                if attempt < retries and err.status in _RETRY_STATUSES:
+                    await asyncio.sleep(_RETRY_DELAY * 2**attempt)
+                    continue
+                # POST only used when authenticating
+                if response.method == HTTPMethod.POST:
+                    raise exc.AuthenticationFailed(  # includes TOO_MANY_REQUESTS
+                        str(err), status=err.status
+                    ) from err
+                if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                    raise exc.RateLimitExceeded(str(err), status=err.status) from err
+                raise exc.RequestFailed(str(err), status=err.status) from err
+
+            # using response causes UnboundLocalError
+            except (aiohttp.ClientError, TimeoutError) as err:
+                if attempt < retries and isinstance(err, _RETRY_ERRORS):
+                    await asyncio.sleep(_RETRY_DELAY * 2**attempt)
+                    continue
+                if method == HTTPMethod.POST:  # POST only used when authenticating
+                    raise exc.AuthenticationFailed(str(err)) from err
+                raise exc.RequestFailed(str(err) or "Request timed out") from err
+
+            return response
+
+        raise AssertionError("unreachable")  # mypy hint
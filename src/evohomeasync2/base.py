@@ -8,12 +8,13 @@ from __future__ import annotations
 import logging
 from datetime import datetime as dt
 from http import HTTPStatus
-from typing import TYPE_CHECKING, NoReturn
+from types import TracebackType
+from typing import TYPE_CHECKING, NoReturn, Self
 
 import aiohttp
 
 from . import exceptions as exc
-from .broker import Broker
+from .broker import DEFAULT_MAX_CONCURRENCY, Broker
 from .controlsystem import ControlSystem
 from .location import Location
 from .schema import SCH_FULL_CONFIG, SCH_USER_ACCOUNT
@@ -106,6 +107,7 @@ class EvohomeClient(EvohomeClientDeprecated):
         access_token: str | None = None,
         access_token_expires: dt | None = None,
         session: None | aiohttp.ClientSession = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
         debug: bool = False,
     ) -> None:
         """Construct the v2 EvohomeClient object.
@@ -117,12 +119,26 @@ class EvohomeClient(EvohomeClientDeprecated):
 
         If access/refresh tokens are provided they will be used to avoid calling the
         authentication service, which is known to be rate limited.
+
+        No more than max_concurrency requests will be in flight at any one time (e.g.
+        when backing up schedules). Setting it to the number of zones (plus DHW) gives
+        the lowest latency, until the vendor's API starts to rate limit.
+
+        If a session is not provided, one is instantiated when first needed and is
+        reused for all requests; use `async with EvohomeClient(...) as evo:`, or call
+        evo.close(), to close it.
         """
 
         if debug:
             _LOGGER.setLevel(logging.DEBUG)
             _LOGGER.debug("Debug mode is explicitly enabled.")
 
+        # NOTE: Semaphore(0) would block forever, whereas TCPConnector(limit=0) is none
+        if max_concurrency < 1:
+            raise exc.InvalidParameter(
+                f"max_concurrency must be at least 1, not {max_concurrency}"
+            )
+
         self._logger = _LOGGER
         self._username = username  # for __str__
 
@@ -134,6 +150,7 @@ class EvohomeClient(EvohomeClientDeprecated):
             access_token=access_token,
             access_token_expires=access_token_expires,
             session=session,
+            max_concurrency=max_concurrency,
         )
 
         self.locations: list[Location] = []
@@ -141,6 +158,21 @@ class EvohomeClient(EvohomeClientDeprecated):
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(username='{self._username}')"
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the client session, unless it was provided by the caller."""
+        await self.broker.close()
+
     @property
     def username(self) -> str:  # TODO: deprecate? or use config JSON?
         return self.broker._credentials["Username"]
@@ -236,7 +268,9 @@ class EvohomeClient(EvohomeClientDeprecated):
         url = f"location/installationInfo?userId={self.account_info['userId']}"
         url += "&includeTemperatureControlSystems=True"
 
-        self._full_config = await self.broker.get(url, schema=SCH_FULL_CONFIG)  # type: ignore[assignment]
+        self._full_config = await self.broker.get(  # type: ignore[assignment]
+            url, schema=SCH_FULL_CONFIG, memoize=True
+        )
 
         # populate each freshly instantiated location with its initial status
         loc_config: _EvoDictT
@@ -5,9 +5,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Mapping
+from copy import deepcopy
 from datetime import datetime as dt, timedelta as td
 from http import HTTPMethod, HTTPStatus
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -23,6 +27,7 @@ from .const import (
     CREDS_USER_PASSWORD,
     URL_BASE,
 )
+from .helpers import json_loads
 from .schema import SCH_OAUTH_TOKEN
 from .schema.account import SZ_ACCESS_TOKEN, SZ_EXPIRES_IN, SZ_REFRESH_TOKEN
 
@@ -32,6 +37,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 8  # max number of simultaneous requests to the vendor
+
 
 _ERR_MSG_LOOKUP_BOTH: dict[int, str] = {  # common to both OAUTH_URL & URL_BASE
     HTTPStatus.INTERNAL_SERVER_ERROR: "Can't reach server (check vendor's status page)",
@@ -67,6 +74,7 @@ class Broker:
         access_token: str | None = None,
         access_token_expires: dt | None = None,
         session: aiohttp.ClientSession | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """A class for interacting with the v2 Evohome API."""
 
@@ -80,55 +88,99 @@ class Broker:
         self.access_token = access_token
         self.access_token_expires = access_token_expires
 
-        self._session = session or aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        )  # ??? can't instantiate aiohttp.ClientSession() here
+        # bound the fan-out of concurrent requests (e.g. when getting all schedules)
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # if not provided, a session is instantiated when first needed (see: _client)
+        self._session = session
+        self._session_is_owned = session is None  # if so, is closed by .close()
+
+        # the request headers, for the current access token, see: _headers()
+        self._cached_headers: tuple[str, Mapping[str, str]] | None = None
+
+        # the most recent valid response per (memoized) URL & its schema, see: get()
+        self._validated: dict[str, tuple[vol.Schema, _EvoSchemaT, _EvoSchemaT]] = {}
+
+    async def close(self) -> None:
+        """Close the session, but only if it was instantiated by the broker."""
+
+        if self._session_is_owned and self._session:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session, instantiating one if required.
+
+        A single session (and its pool of keep-alive connections) is used for all
+        requests. It can't be instantiated in __init__() as a running event loop is
+        required. The pool size matches the number of concurrent requests.
+        """
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_concurrency,
+                    limit_per_host=self._max_concurrency,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
 
     async def _client(
         self,
         method: HTTPMethod,
         url: str,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | str | None = None,  # bytes/str is JSON, if PUT
         json: dict[str, Any] | None = None,
-        headers: dict[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> tuple[aiohttp.ClientResponse, None | str | _EvoDictT | _EvoListT]:
         """Wrapper for aiohttp.ClientSession()."""
 
-        assert self._session is not None  # mypy hint
+        session = self._get_session()
 
-        if headers is None:
+        if headers is None:  # NOTE: only once per request, incl. the Content-Type
             headers = await self._headers()
 
         if method == HTTPMethod.GET:
-            _session_method = self._session.get
+            _session_method = session.get
             kwargs = {"headers": headers}
 
         elif method == HTTPMethod.POST:
-            _session_method = self._session.post
+            _session_method = session.post
             kwargs = {"headers": headers, "data": data}  # type: ignore[dict-item]
 
         elif method == HTTPMethod.PUT:
-            _session_method = self._session.put
-            # headers["Content-Type"] = "application/json"
-            kwargs = {"headers": headers, "json": json}  # type: ignore[dict-item]
-
-        async with _session_method(url, **kwargs) as response:  # type: ignore[arg-type]
+            _session_method = session.put
+            if data is None:
+                kwargs = {"headers": headers, "json": json}  # type: ignore[dict-item]
+            else:  # already serialized (NB: the headers include the Content-Type)
+                kwargs = {"headers": headers, "data": data}  # type: ignore[dict-item]
+
+        async with (
+            self._semaphore,  # NOTE: acquire only after self._headers(), above
+            _session_method(url, **kwargs) as response,  # type: ignore[arg-type]
+        ):
             if not response.content_length:
                 content = None
-                _LOGGER.info(f"{method} {url} ({response.status}) = {content}")
+                _LOGGER.info("%s %s (%s) = %s", method, url, response.status, content)
 
             elif response.content_type == "application/json":
-                content = await response.json()
-                _LOGGER.info(f"{method} {url} ({response.status}) = {content}")
+                content = await response.json(loads=json_loads)
+                _LOGGER.info("%s %s (%s) = %s", method, url, response.status, content)
 
             else:  # assume "text/plain" or "text/html"
                 content = await response.text()
-                _LOGGER.info(f"{method} {url} ({response.status}) = {content}")
+                _LOGGER.info("%s %s (%s) = %s", method, url, response.status, content)
 
             return response, content  # FIXME: is messy to return response
 
-    async def _headers(self) -> dict[str, str]:
-        """Ensure the Authorization Header has a valid Access Token."""
+    async def _headers(self) -> Mapping[str, str]:
+        """Ensure the Authorization Header has a valid Access Token.
+
+        The (read-only) headers are built only once per access token.
+        """
 
         if not self.access_token or not self.access_token_expires:
             await self._basic_login()
@@ -138,11 +190,18 @@ class Broker:
 
         assert isinstance(self.access_token, str)  # mypy
 
-        return {
-            "Accept": AUTH_HEADER_ACCEPT,
-            "Authorization": "bearer " + self.access_token,
-            "Content-Type": "application/json",
-        }
+        if self._cached_headers and self._cached_headers[0] == self.access_token:
+            return self._cached_headers[1]
+
+        headers = MappingProxyType(
+            {
+                "Accept": AUTH_HEADER_ACCEPT,
+                "Authorization": "bearer " + self.access_token,
+                "Content-Type": "application/json",
+            }
+        )
+        self._cached_headers = (self.access_token, headers)
+        return headers
 
     async def _basic_login(self) -> None:
         """Obtain a new access token from the vendor (as it is invalid, or expired).
@@ -220,11 +279,17 @@ class Broker:
                 f"Invalid response from server: {err}"
             ) from err
 
-    async def get(self, url: str, schema: vol.Schema | None = None) -> _EvoSchemaT:
+    async def get(
+        self, url: str, schema: vol.Schema | None = None, *, memoize: bool = False
+    ) -> _EvoSchemaT:
         """Call the RESTful API with a GET.
 
         Optionally checks the response JSON against the expected schema and logs a
         warning if it doesn't match (NB: does not raise a vol.Invalid).
+
+        If memoize is True (e.g. for the config, which rarely changes), and the response
+        is unchanged since the last GET, (a copy of) the previously validated result is
+        returned rather than re-validated.
         """
 
         response: aiohttp.ClientResponse
@@ -244,21 +309,39 @@ class Broker:
         except aiohttp.ClientError as err:  # e.g. ClientConnectionError
             raise exc.RequestFailed(str(err)) from err
 
-        if schema:
-            try:
-                content = schema(content)
-            except vol.Invalid as err:
-                self._logger.info(f"Response JSON may be invalid: GET {url}: {err}")
+        if not schema:
+            return content
 
-        return content
+        if memoize and (cached := self._validated.get(url)) and cached[0] is schema:
+            if cached[1] == content:  # much cheaper than walking the schema
+                return deepcopy(cached[2])  # the caller may mutate its copy
+
+        try:
+            result: _EvoSchemaT = schema(content)
+        except vol.Invalid as err:
+            self._logger.info(f"Response JSON may be invalid: GET {url}: {err}")
+            return content
+
+        if not memoize:
+            return result
+
+        self._validated[url] = (schema, content, result)
+        return deepcopy(result)
 
     async def put(
-        self, url: str, json: _EvoDictT | str, schema: vol.Schema | None = None
+        self,
+        url: str,
+        json: _EvoDictT | str,
+        schema: vol.Schema | None = None,
+        data: bytes | str | None = None,
     ) -> dict[str, Any] | list[dict[str, Any]]:  # NOTE: not _EvoSchemaT
         """Call the RESTful API with a PUT.
 
         Optionally checks the request JSON against the expected schema and logs a
         warning if it doesn't match (NB: does not raise a vol.Invalid).
+
+        If data is provided, it is sent as the (already serialized) JSON, rather than
+        serializing the JSON again.
         """
 
         response: aiohttp.ClientResponse
@@ -274,6 +357,7 @@ class Broker:
             response, content = await self._client(  # type: ignore[assignment]
                 HTTPMethod.PUT,
                 f"{URL_BASE}/{url}",
+                data=data,
                 json=json,  # type: ignore[arg-type]
             )
             response.raise_for_status()
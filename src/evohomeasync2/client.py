@@ -17,7 +17,7 @@ import click
 from . import HotWater, Zone
 from .base import EvohomeClient
 from .const import SZ_NAME, SZ_SCHEDULE
-from .controlsystem import ControlSystem
+from .controlsystem import ControlSystem, _dumps, _dumps_schedules
 from .schema.account import SZ_ACCESS_TOKEN, SZ_ACCESS_TOKEN_EXPIRES, SZ_REFRESH_TOKEN
 
 # debug flags should be False for end-users
@@ -188,15 +188,14 @@ def get_schedule(
 
             schedule = await child.get_schedule()
 
-        finally:  # FIXME: EvohomeClient should do this...
-            assert evo.broker._session is not None  # mypy hint
-            await evo.broker._session.close()  # FIXME
+        finally:
+            await evo.close()
 
         schedules = {
             child._id: {SZ_NAME: child.name, SZ_SCHEDULE: schedule},
         }
 
-        filename.write(json.dumps(schedules, indent=4))
+        filename.write(_dumps(schedules).decode())  # as for tcs.backup_schedules()
         filename.write("\r\n\r\n")
 
     print("\r\nclient.py: Starting backup...")
@@ -232,11 +231,10 @@ def get_schedules(ctx: click.Context, loc_idx: int, filename: TextIOWrapper) ->
             tcs: ControlSystem = _get_tcs(evo, loc_idx)
             schedules = await tcs._get_schedules()
 
-        finally:  # FIXME: EvohomeClient should do this...
-            assert evo.broker._session is not None  # mypy hint
-            await evo.broker._session.close()  # FIXME
+        finally:
+            await evo.close()
 
-        filename.write(json.dumps(schedules, indent=4))
+        filename.writelines(c.decode() for c in _dumps_schedules(schedules))
         filename.write("\r\n\r\n")
 
     print("\r\nclient.py: Starting backup...")
@@ -272,9 +270,8 @@ def set_schedules(ctx: click.Context, loc_idx: int, filename: TextIOWrapper) ->
             tcs: ControlSystem = _get_tcs(evo, loc_idx)
             success = await tcs._set_schedules(schedules)
 
-        finally:  # FIXME: EvohomeClient should do this...
-            assert evo.broker._session is not None  # mypy hint
-            await evo.broker._session.close()  # FIXME
+        finally:
+            await evo.close()
 
         return success
 
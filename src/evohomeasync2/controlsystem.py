@@ -8,9 +8,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import Coroutine, Iterator
 from datetime import datetime as dt
-from typing import TYPE_CHECKING, Final, NoReturn
+from typing import TYPE_CHECKING, Any, Final, NoReturn, TypeVar
 
 from . import exceptions as exc
 from .const import (
@@ -23,6 +25,7 @@ from .const import (
     SZ_THERMOSTAT,
     SystemMode,
 )
+from .helpers import json_loads, orjson
 from .hotwater import HotWater
 from .schema import SCH_TCS_STATUS
 from .schema.const import (
@@ -61,9 +64,60 @@ if TYPE_CHECKING:
     )
 
 
+def _dumps(obj: _ScheduleT) -> bytes:
+    """Serialize the object to (indented) JSON."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+def _dumps_schedules(schedules: _ScheduleT) -> Iterator[bytes]:
+    """Serialize the schedules to JSON, one DHW/zone at a time, for a backup file.
+
+    Together, the chunks are the same as serializing the whole dict at once, but the
+    entire (indented) document is never held in memory.
+    """
+
+    if not schedules:  # b"{}", not b"{\n}"
+        yield _dumps(schedules)
+        return
+
+    yield b"{"
+    for idx, (id, schedule) in enumerate(schedules.items()):
+        # a dict of one item: b'{\n  "id": {...}\n}' -> b'\n  "id": {...}'
+        yield (b"," if idx else b"") + _dumps({id: schedule})[1:-2]
+    yield b"\n}"
+
+
+def _loads_schedules(data: bytes) -> _ScheduleT:
+    """Deserialize the schedules from JSON, as read from a backup file."""
+    return json_loads(data)  # type: ignore[no-any-return]
+
+
+_T = TypeVar("_T")
+
+
+async def _gather(*coros: Coroutine[Any, Any, _T]) -> list[_T]:
+    """Run the coroutines concurrently, and return their results (in order).
+
+    Unlike asyncio.gather(), if any one fails then the others are cancelled (rather
+    than left running), and its exception is raised (rather than an ExceptionGroup).
+    """
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(c) for c in coros]
+    except ExceptionGroup as err:
+        raise err.exceptions[0] from None  # e.g. exc.RequestFailed
+
+    return [t.result() for t in tasks]
+
+
 class _ControlSystemDeprecated:
     """Deprecated attributes and methods removed from the evohome-client namespace."""
 
+    __slots__ = ()
+
     async def set_status_reset(self, *args, **kwargs) -> NoReturn:  # type: ignore[no-untyped-def]
         raise exc.DeprecationError(
             f"{self}: .set_status_reset() is deprecrated, use .reset_mode()"
@@ -121,6 +175,18 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
     STATUS_SCHEMA: Final[vol.Schema] = SCH_TCS_STATUS
     TYPE: Final = SZ_TEMPERATURE_CONTROL_SYSTEM  # type: ignore[misc]
 
+    __slots__ = (
+        "gateway",
+        "location",
+        "_config",
+        "_status",
+        "_zones",
+        "zones",
+        "zones_by_id",
+        "hotwater",
+        "_system_modes",
+    )
+
     def __init__(self, gateway: Gateway, config: _EvoDictT) -> None:
         super().__init__(config[SZ_SYSTEM_ID], gateway._broker, gateway._logger)
 
@@ -132,6 +198,10 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
         }
         self._status: _EvoDictT = {}
 
+        self._system_modes: Final[frozenset[str]] = frozenset(
+            m[SZ_SYSTEM_MODE] for m in self._config[SZ_ALLOWED_SYSTEM_MODES]
+        )
+
         self._zones: list[Zone] = []
         self.zones: dict[str, Zone] = {}  # zone by name! what to do if name changed?
         self.zones_by_id: dict[str, Zone] = {}
@@ -225,7 +295,7 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
 
         request: _EvoDictT
 
-        if mode not in [m[SZ_SYSTEM_MODE] for m in self.allowedSystemModes]:
+        if mode not in self._system_modes:
             raise exc.InvalidParameter(f"{self}: Unsupported/unknown mode: {mode}")
 
         if until is None:
@@ -272,75 +342,70 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
 
         await self.location.refresh_status()
 
-        result = []
+        result: _EvoListT = []
 
-        if dhw := self.hotwater:
-            dhw_status = {
-                SZ_THERMOSTAT: "DOMESTIC_HOT_WATER",
-                SZ_ID: dhw.dhwId,
-                SZ_NAME: dhw.name,
-                SZ_TEMP: None,
-            }
+        # NOTE: each status attr is a property (a dict lookup), so is accessed once
 
-            if (
-                isinstance(dhw.temperatureStatus, dict)
-                and dhw.temperatureStatus[SZ_IS_AVAILABLE]
-            ):
-                dhw_status[SZ_TEMP] = dhw.temperatureStatus[SZ_TEMPERATURE]
-
-            result.append(dhw_status)
+        if dhw := self.hotwater:
+            temp_status = dhw.temperatureStatus
+
+            result.append(
+                {
+                    SZ_THERMOSTAT: "DOMESTIC_HOT_WATER",
+                    SZ_ID: dhw.dhwId,
+                    SZ_NAME: dhw.name,
+                    SZ_TEMP: temp_status[SZ_TEMPERATURE]
+                    if temp_status and temp_status[SZ_IS_AVAILABLE]
+                    else None,
+                }
+            )
 
         for zone in self._zones:
-            zone_status = {
-                SZ_THERMOSTAT: "EMEA_ZONE",
-                SZ_ID: zone.zoneId,
-                SZ_NAME: zone.name,
-                SZ_SETPOINT: None,
-                SZ_TEMP: None,
-            }
-
-            if isinstance(zone.setpointStatus, dict):
-                zone_status[SZ_SETPOINT] = zone.setpointStatus[
-                    SZ_TARGET_HEAT_TEMPERATURE
-                ]
-
-            if (
-                isinstance(zone.temperatureStatus, dict)
-                and zone.temperatureStatus[SZ_IS_AVAILABLE]
-            ):
-                zone_status[SZ_TEMP] = zone.temperatureStatus[SZ_TEMPERATURE]
-
-            result.append(zone_status)
+            setpoint_status = zone.setpointStatus
+            temp_status = zone.temperatureStatus
+
+            result.append(
+                {
+                    SZ_THERMOSTAT: "EMEA_ZONE",
+                    SZ_ID: zone.zoneId,
+                    SZ_NAME: zone.name,
+                    SZ_SETPOINT: setpoint_status[SZ_TARGET_HEAT_TEMPERATURE]
+                    if setpoint_status
+                    else None,
+                    SZ_TEMP: temp_status[SZ_TEMPERATURE]
+                    if temp_status and temp_status[SZ_IS_AVAILABLE]
+                    else None,
+                }
+            )
 
         return result
 
-    async def _get_schedules(self) -> _ScheduleT:
-        """Get the schedule for every DHW/zone of this TCS."""
+    async def _get_schedules(self, force_update: bool = False) -> _ScheduleT:
+        """Get the schedule for every DHW/zone of this TCS.
+
+        Recently retrieved schedules are returned from the cache, unless forced.
+        """
 
         async def get_schedule(child: HotWater | Zone) -> _ScheduleT:
             try:
-                return await child.get_schedule()
+                return await child.get_schedule(force_update=force_update)
             except exc.InvalidSchedule:
                 self._logger.warning(
                     f"Ignoring schedule of {child._id} ({child.name}): missing/invalid"
                 )
             return {}
 
-        schedules = {}
-
-        for zone in self._zones:
-            schedules[zone.zoneId] = {
-                SZ_NAME: zone.name,
-                SZ_SCHEDULE: await get_schedule(zone),
-            }
-
+        children: list[HotWater | Zone] = list(self._zones)
         if self.hotwater:
-            schedules[self.hotwater.dhwId] = {
-                SZ_NAME: self.hotwater.name,
-                SZ_SCHEDULE: await get_schedule(self.hotwater),
-            }
+            children.append(self.hotwater)
+
+        # the GETs are independent of each other, so can be made concurrently
+        results = await _gather(*(get_schedule(c) for c in children))
 
-        return schedules
+        return {
+            c._id: {SZ_NAME: c.name, SZ_SCHEDULE: s}
+            for c, s in zip(children, results, strict=True)
+        }
 
     async def backup_schedules(self, filename: _FilePathT) -> None:
         """Backup all schedules from the control system to the file."""
@@ -352,8 +417,11 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
 
         schedules = await self._get_schedules()
 
-        with open(filename, "w") as file_output:
-            file_output.write(json.dumps(schedules, indent=4))
+        def write_file() -> None:  # blocking I/O, so run in a thread
+            with open(filename, "wb") as file_output:
+                file_output.writelines(_dumps_schedules(schedules))
+
+        await asyncio.to_thread(write_file)
 
         self._logger.info("Schedules: Backup completed")
 
@@ -368,10 +436,10 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
             name = schedule.get(SZ_NAME)
 
             if self.hotwater and self.hotwater.dhwId == id:
-                await self.hotwater.set_schedule(json.dumps(schedule[SZ_SCHEDULE]))
+                await self.hotwater.set_schedule(schedule[SZ_SCHEDULE])
 
             elif zone := self.zones_by_id.get(id):
-                await zone.set_schedule(json.dumps(schedule[SZ_SCHEDULE]))
+                await zone.set_schedule(schedule[SZ_SCHEDULE])
 
             else:
                 self._logger.warning(
@@ -388,10 +456,10 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
             name = schedule[SZ_NAME]  # don't use .get()
 
             if self.hotwater and name == self.hotwater.name:
-                await self.hotwater.set_schedule(json.dumps(schedule[SZ_SCHEDULE]))
+                await self.hotwater.set_schedule(schedule[SZ_SCHEDULE])
 
             elif zone := self.zones.get(name):
-                await zone.set_schedule(json.dumps(schedule[SZ_SCHEDULE]))
+                await zone.set_schedule(schedule[SZ_SCHEDULE])
 
             else:
                 self._logger.warning(
@@ -402,17 +470,14 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
 
             return True
 
-        with_errors = False
-
-        for id, schedule in schedules.items():
-            assert isinstance(schedule, dict)  # mypy
+        restore = restore_by_name if match_by_name else restore_by_id
 
-            if match_by_name:
-                matched = await restore_by_name(id, schedule)
-            else:
-                matched = await restore_by_id(id, schedule)
+        # the PUTs are independent of each other, so can be made concurrently
+        matched = await _gather(
+            *(restore(id, schedule) for id, schedule in schedules.items())
+        )
 
-            with_errors = with_errors and not matched
+        with_errors = not all(matched)
 
         success = not with_errors or len(schedules) == len(self.zones) + (
             1 if self.hotwater else 0
@@ -439,9 +504,11 @@ class ControlSystem(ActiveFaultsBase, _ControlSystemDeprecated):
             f" to {self.systemId} ({self.location.name}), from {filename}"
         )
 
-        with open(filename) as file_input:
-            schedule_db = file_input.read()
-            schedules: _ScheduleT = json.loads(schedule_db)
+        def read_file() -> _ScheduleT:  # blocking I/O, so run in a thread
+            with open(filename, "rb") as file_input:
+                return _loads_schedules(file_input.read())
+
+        schedules = await asyncio.to_thread(read_file)
 
         await self._set_schedules(schedules)
 
@@ -33,6 +33,14 @@ class Gateway(ActiveFaultsBase):
     STATUS_SCHEMA: Final[vol.Schema] = SCH_GATEWAY
     TYPE: Final = SZ_GATEWAY  # type: ignore[misc]
 
+    __slots__ = (
+        "location",
+        "_config",
+        "_status",
+        "_control_systems",
+        "control_systems",
+    )
+
     def __init__(self, location: Location, config: _EvoDictT) -> None:
         super().__init__(
             config[SZ_GATEWAY_INFO][SZ_GATEWAY_ID], location._broker, location._logger
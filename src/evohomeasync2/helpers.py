@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+"""evohomeasync2 - shared helpers (also used by evohomeasync)."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # orjson is optional, it is merely faster
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["json_dumps", "json_loads", "orjson"]
+
+
+# e.g. the installation info/full data are large JSON documents, orjson is much faster
+json_dumps: Callable[[Any], bytes | str] = orjson.dumps if orjson else json.dumps
+json_loads: Callable[[bytes | str], Any] = orjson.loads if orjson else json.loads
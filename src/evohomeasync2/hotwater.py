@@ -39,6 +39,8 @@ if TYPE_CHECKING:
 class HotWaterDeprecated:
     """Deprecated attributes and methods removed from the evohome-client namespace."""
 
+    __slots__ = ()
+
     @property
     def zoneId(self) -> NoReturn:
         raise exc.DeprecationError(
@@ -75,6 +77,8 @@ class HotWater(HotWaterDeprecated, _ZoneBase):
     SCH_SCHEDULE_GET: Final[vol.Schema] = SCH_GET_SCHEDULE_DHW  # type: ignore[misc]
     SCH_SCHEDULE_PUT: Final[vol.Schema] = SCH_PUT_SCHEDULE_DHW  # type: ignore[misc]
 
+    __slots__ = ()
+
     def __init__(self, tcs: ControlSystem, config: _EvoDictT) -> None:
         super().__init__(config[SZ_DHW_ID], tcs, config)
 
@@ -10,6 +10,7 @@ import voluptuous as vol
 from .const import (
     REGEX_DHW_ID,
     REGEX_SYSTEM_ID,
+    REGEX_TIMING_RESOLUTION,
     REGEX_ZONE_ID,
     SZ_ALLOWED_FAN_MODES,
     SZ_ALLOWED_MODES,
@@ -87,6 +88,7 @@ from .const import (
     ZoneType,
     obfuscate as _obfuscate,
 )
+from .helpers import fullmatch, one_of
 
 # These are best guess
 MAX_HEAT_SETPOINT_LOWER: Final[float] = 21.0
@@ -98,7 +100,7 @@ MIN_HEAT_SETPOINT_UPPER: Final[float] = 21.0
 
 SCH_SYSTEM_MODE_PERM = vol.Schema(
     {
-        vol.Required(SZ_SYSTEM_MODE): vol.Any(
+        vol.Required(SZ_SYSTEM_MODE): one_of(
             str(SystemMode.AUTO),
             str(SystemMode.AUTO_WITH_RESET),
             str(SystemMode.HEATING_OFF),
@@ -114,7 +116,7 @@ SCH_SYSTEM_MODE_PERM = vol.Schema(
 
 SCH_SYSTEM_MODE_TEMP = vol.Schema(
     {
-        vol.Required(SZ_SYSTEM_MODE): vol.Any(
+        vol.Required(SZ_SYSTEM_MODE): one_of(
             str(SystemMode.AUTO_WITH_ECO),
             str(SystemMode.AWAY),
             str(SystemMode.CUSTOM),
@@ -124,7 +126,7 @@ SCH_SYSTEM_MODE_TEMP = vol.Schema(
         vol.Required(SZ_CAN_BE_TEMPORARY): True,
         vol.Required(SZ_MAX_DURATION): str,  # "99.00:00:00"
         vol.Required(SZ_TIMING_RESOLUTION): str,  # "1.00:00:00"
-        vol.Required(SZ_TIMING_MODE): vol.Any(SZ_DURATION, SZ_PERIOD),
+        vol.Required(SZ_TIMING_MODE): one_of(SZ_DURATION, SZ_PERIOD),
     },
     extra=vol.PREVENT_EXTRA,
 )
@@ -137,7 +139,7 @@ SCH_DHW_STATE_CAPABILITIES_RESPONSE = vol.Schema(
         vol.Required(SZ_ALLOWED_STATES): list(m.value for m in DhwState),
         vol.Required(SZ_ALLOWED_MODES): list(m.value for m in ZoneMode),
         vol.Required(SZ_MAX_DURATION): str,
-        vol.Required(SZ_TIMING_RESOLUTION): vol.Datetime(format="00:%M:00"),
+        vol.Required(SZ_TIMING_RESOLUTION): fullmatch(REGEX_TIMING_RESOLUTION),
     },
     extra=vol.PREVENT_EXTRA,
 )
@@ -146,8 +148,8 @@ SCH_SCHEDULE_CAPABILITIES_RESPONSE = vol.Schema(
     {
         vol.Required(SZ_MAX_SWITCHPOINTS_PER_DAY): int,  # 6
         vol.Required(SZ_MIN_SWITCHPOINTS_PER_DAY): int,  # 1
-        vol.Required(SZ_TIMING_RESOLUTION): vol.Datetime(
-            format="00:%M:00"
+        vol.Required(SZ_TIMING_RESOLUTION): fullmatch(
+            REGEX_TIMING_RESOLUTION
         ),  # "00:10:00"
     },
     extra=vol.PREVENT_EXTRA,
@@ -155,7 +157,7 @@ SCH_SCHEDULE_CAPABILITIES_RESPONSE = vol.Schema(
 
 SCH_DHW = vol.Schema(
     {
-        vol.Required(SZ_DHW_ID): vol.Match(REGEX_DHW_ID),
+        vol.Required(SZ_DHW_ID): fullmatch(REGEX_DHW_ID),
         vol.Required(
             SZ_DHW_STATE_CAPABILITIES_RESPONSE
         ): SCH_DHW_STATE_CAPABILITIES_RESPONSE,
@@ -172,7 +174,7 @@ SCH_VACATION_HOLD_CAPABILITIES = vol.Schema(
         vol.Required(SZ_IS_CANCELABLE): bool,
         vol.Optional(SZ_MAX_DURATION): str,
         vol.Optional(SZ_MIN_DURATION): str,
-        vol.Optional(SZ_TIMING_RESOLUTION): vol.Datetime(format="00:%M:00"),
+        vol.Optional(SZ_TIMING_RESOLUTION): fullmatch(REGEX_TIMING_RESOLUTION),
     },
     extra=vol.PREVENT_EXTRA,
 )
@@ -192,8 +194,8 @@ SCH_SETPOINT_CAPABILITIES = vol.Schema(  # min/max as per evohome
         vol.Required(SZ_ALLOWED_SETPOINT_MODES): list(m.value for m in ZoneMode),
         vol.Required(SZ_VALUE_RESOLUTION): float,  # 0.5
         vol.Required(SZ_MAX_DURATION): str,  # "1.00:00:00"
-        vol.Required(SZ_TIMING_RESOLUTION): vol.Datetime(
-            format="00:%M:00"
+        vol.Required(SZ_TIMING_RESOLUTION): fullmatch(
+            REGEX_TIMING_RESOLUTION
         ),  # "00:10:00"
         vol.Optional(
             SZ_VACATION_HOLD_CAPABILITIES
@@ -213,21 +215,21 @@ SCH_SCHEDULE_CAPABILITIES = SCH_SCHEDULE_CAPABILITIES_RESPONSE.extend(
 
 SCH_FAN_MODE = vol.Schema(
     {
-        vol.Required(SZ_FAN_MODE): vol.In([m.value for m in FanMode]),
+        vol.Required(SZ_FAN_MODE): one_of(*(m.value for m in FanMode)),
     },
     extra=vol.PREVENT_EXTRA,
 )
 
 SCH_ZONE = vol.Schema(
     {
-        vol.Required(SZ_ZONE_ID): vol.Match(REGEX_ZONE_ID),
-        vol.Required(SZ_MODEL_TYPE): vol.In([m.value for m in ZoneModelType]),
+        vol.Required(SZ_ZONE_ID): fullmatch(REGEX_ZONE_ID),
+        vol.Required(SZ_MODEL_TYPE): one_of(*(m.value for m in ZoneModelType)),
         vol.Required(SZ_NAME): str,
         vol.Required(SZ_SETPOINT_CAPABILITIES): SCH_SETPOINT_CAPABILITIES,
         vol.Optional(
             SZ_SCHEDULE_CAPABILITIES
         ): SCH_SCHEDULE_CAPABILITIES,  # required for evo, optional for FocusProWifiRetail
-        vol.Required(SZ_ZONE_TYPE): vol.In([m.value for m in ZoneType]),
+        vol.Required(SZ_ZONE_TYPE): one_of(*(m.value for m in ZoneType)),
         vol.Optional(SZ_ALLOWED_FAN_MODES): list,  # FocusProWifiRetail
     },
     extra=vol.PREVENT_EXTRA,
@@ -235,8 +237,8 @@ SCH_ZONE = vol.Schema(
 
 SCH_TEMPERATURE_CONTROL_SYSTEM = vol.Schema(
     {
-        vol.Required(SZ_SYSTEM_ID): vol.Match(REGEX_SYSTEM_ID),
-        vol.Required(SZ_MODEL_TYPE): vol.In([m.value for m in TcsModelType]),
+        vol.Required(SZ_SYSTEM_ID): fullmatch(REGEX_SYSTEM_ID),
+        vol.Required(SZ_MODEL_TYPE): one_of(*(m.value for m in TcsModelType)),
         vol.Required(SZ_ALLOWED_SYSTEM_MODES): [SCH_ALLOWED_SYSTEM_MODE],
         vol.Required(SZ_ZONES): vol.All([SCH_ZONE], vol.Length(min=1, max=12)),
         vol.Optional(SZ_DHW): SCH_DHW,
@@ -16,6 +16,9 @@ REGEX_LOCATION_ID = r"[0-9]*"
 REGEX_SYSTEM_ID = r"[0-9]*"
 REGEX_ZONE_ID = r"[0-9]*"
 
+REGEX_TIME_OF_DAY = r"([01][0-9]|2[0-3]):[0-5][0-9]:00"  # cf. "%H:%M:00"
+REGEX_TIMING_RESOLUTION = r"00:[0-5][0-9]:00"  # cf. "00:%M:00"
+
 
 # These are vendor-specific constants, used for keys
 SZ_ACTIVE_FAULTS: Final = "activeFaults"
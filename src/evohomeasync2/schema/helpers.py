@@ -3,6 +3,12 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
+from typing import Any
+
+import voluptuous as vol
+
 
 def camel_case(s: str) -> str:
     """Convert a PascalCase string to camelCase."""
@@ -12,3 +18,38 @@ def camel_case(s: str) -> str:
 def pascal_case(s: str) -> str:
     """Convert a camelCase string to PascalCase."""
     return s[:1].upper() + s[1:]
+
+
+def fullmatch(pattern: str) -> Callable[[Any], str]:
+    """Return a validator of strings that wholly match a regex (cf. vol.Match).
+
+    Unlike vol.Match, the regex is anchored at both ends (i.e. re.fullmatch()).
+    """
+
+    regex = re.compile(pattern)
+
+    def validator(value: Any) -> str:
+        if not isinstance(value, str) or not regex.fullmatch(value):
+            raise vol.Invalid(f"does not (fully) match regular expression {pattern}")
+        return value
+
+    return validator
+
+
+def one_of(*values: str) -> Callable[[Any], str]:
+    """Return a validator of strings that are one of the values (cf. vol.In).
+
+    Unlike vol.Any(*values) (or vol.In(list)), membership is a hashed lookup.
+    """
+
+    allowed = frozenset(values)
+
+    def validator(value: Any) -> str:
+        try:
+            if value in allowed:
+                return value  # type: ignore[no-any-return]
+        except TypeError:  # unhashable, e.g. a dict
+            pass
+        raise vol.Invalid(f"value must be one of {sorted(allowed)}")
+
+    return validator
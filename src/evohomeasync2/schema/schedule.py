@@ -7,6 +7,7 @@ import voluptuous as vol
 
 from .const import (
     DAYS_OF_WEEK,
+    REGEX_TIME_OF_DAY,
     SZ_COOL_SETPOINT,
     SZ_DAILY_SCHEDULES,
     SZ_DAY_OF_WEEK,
@@ -17,15 +18,15 @@ from .const import (
     SZ_SWITCHPOINTS,
     SZ_TIME_OF_DAY,
 )
-from .helpers import pascal_case
+from .helpers import fullmatch, one_of, pascal_case
 from .typing import _EvoDictT, _EvoListT
 
 #
 # These are returned from vendor's API (GET)...
 SCH_GET_SWITCHPOINT_DHW = vol.Schema(  # TODO: checkme
     {
-        vol.Required(SZ_DHW_STATE): vol.Any(SZ_ON, SZ_OFF),
-        vol.Required(SZ_TIME_OF_DAY): vol.Datetime(format="%H:%M:00"),
+        vol.Required(SZ_DHW_STATE): one_of(SZ_ON, SZ_OFF),
+        vol.Required(SZ_TIME_OF_DAY): fullmatch(REGEX_TIME_OF_DAY),
     },
     extra=vol.PREVENT_EXTRA,
 )
@@ -34,14 +35,14 @@ SCH_GET_SWITCHPOINT_ZONE = vol.Schema(
     {
         vol.Optional(SZ_COOL_SETPOINT): float,  # an extrapolation
         vol.Required(SZ_HEAT_SETPOINT): vol.All(float, vol.Range(min=5, max=35)),
-        vol.Required(SZ_TIME_OF_DAY): vol.Datetime(format="%H:%M:00"),
+        vol.Required(SZ_TIME_OF_DAY): fullmatch(REGEX_TIME_OF_DAY),
     },
     extra=vol.PREVENT_EXTRA,
 )
 
 SCH_GET_DAY_OF_WEEK_DHW = vol.Schema(
     {
-        vol.Required(SZ_DAY_OF_WEEK): vol.In(DAYS_OF_WEEK),
+        vol.Required(SZ_DAY_OF_WEEK): one_of(*DAYS_OF_WEEK),
         vol.Required(SZ_SWITCHPOINTS): [SCH_GET_SWITCHPOINT_DHW],
     },
     extra=vol.PREVENT_EXTRA,
@@ -49,7 +50,7 @@ SCH_GET_DAY_OF_WEEK_DHW = vol.Schema(
 
 SCH_GET_DAY_OF_WEEK_ZONE = vol.Schema(
     {
-        vol.Required(SZ_DAY_OF_WEEK): vol.In(DAYS_OF_WEEK),
+        vol.Required(SZ_DAY_OF_WEEK): one_of(*DAYS_OF_WEEK),
         vol.Required(SZ_SWITCHPOINTS): [SCH_GET_SWITCHPOINT_ZONE],
     },
     extra=vol.PREVENT_EXTRA,
@@ -80,8 +81,8 @@ SCH_GET_SCHEDULE = vol.Schema(  # PUT /{self.TYPE}/{self._id}/schedule
 # This is after modified by evohome-client (PUT), an evohome-client anachronism?
 SCH_PUT_SWITCHPOINT_DHW = vol.Schema(  # TODO: checkme
     {
-        vol.Required(pascal_case(SZ_DHW_STATE)): vol.Any(SZ_ON, SZ_OFF),
-        vol.Required(pascal_case(SZ_TIME_OF_DAY)): vol.Datetime(format="%H:%M:00"),
+        vol.Required(pascal_case(SZ_DHW_STATE)): one_of(SZ_ON, SZ_OFF),
+        vol.Required(pascal_case(SZ_TIME_OF_DAY)): fullmatch(REGEX_TIME_OF_DAY),
     },
     extra=vol.PREVENT_EXTRA,
 )
@@ -89,7 +90,7 @@ SCH_PUT_SWITCHPOINT_DHW = vol.Schema(  # TODO: checkme
 SCH_PUT_SWITCHPOINT_ZONE = vol.Schema(
     {  # NOTE: SZ_HEAT_SETPOINT is not .capitalized()
         vol.Required(SZ_HEAT_SETPOINT): vol.All(float, vol.Range(min=5, max=35)),
-        vol.Required(pascal_case(SZ_TIME_OF_DAY)): vol.Datetime(format="%H:%M:00"),
+        vol.Required(pascal_case(SZ_TIME_OF_DAY)): fullmatch(REGEX_TIME_OF_DAY),
     },
     extra=vol.PREVENT_EXTRA,
 )
@@ -135,6 +136,14 @@ SCH_PUT_SCHEDULE = vol.Schema(  # PUT /{self.TYPE}/{self._id}/schedule
 
 
 #
+# the PascalCase keys of the PUT format (SZ_HEAT_SETPOINT is an exception)
+_PUT_DAILY_SCHEDULES = pascal_case(SZ_DAILY_SCHEDULES)
+_PUT_DAY_OF_WEEK = pascal_case(SZ_DAY_OF_WEEK)
+_PUT_DHW_STATE = pascal_case(SZ_DHW_STATE)
+_PUT_SWITCHPOINTS = pascal_case(SZ_SWITCHPOINTS)
+_PUT_TIME_OF_DAY = pascal_case(SZ_TIME_OF_DAY)
+
+
 def convert_to_put_schedule(schedule: _EvoDictT) -> _EvoDictT:
     """Convert a schedule to the format used by our get/set_schedule() methods.
 
@@ -142,10 +151,10 @@ def convert_to_put_schedule(schedule: _EvoDictT) -> _EvoDictT:
     """
 
     put_schedule: dict[str, _EvoListT] = {}
-    put_schedule[pascal_case(SZ_DAILY_SCHEDULES)] = []
+    put_schedule[_PUT_DAILY_SCHEDULES] = []
 
     for day_of_week, day_schedule in enumerate(schedule[SZ_DAILY_SCHEDULES]):
-        put_day_schedule: _EvoDictT = {pascal_case(SZ_DAY_OF_WEEK): day_of_week}
+        put_day_schedule: _EvoDictT = {_PUT_DAY_OF_WEEK: day_of_week}
         put_switchpoints: _EvoListT = []
 
         for get_sp in day_schedule[SZ_SWITCHPOINTS]:
@@ -153,13 +162,13 @@ def convert_to_put_schedule(schedule: _EvoDictT) -> _EvoDictT:
                 # NOTE: this key is not converted to PascalCase
                 put_sp = {SZ_HEAT_SETPOINT: get_sp[SZ_HEAT_SETPOINT]}  #  camelCase
             else:
-                put_sp = {pascal_case(SZ_DHW_STATE): get_sp[SZ_DHW_STATE]}
+                put_sp = {_PUT_DHW_STATE: get_sp[SZ_DHW_STATE]}
 
-            put_sp[pascal_case(SZ_TIME_OF_DAY)] = get_sp[SZ_TIME_OF_DAY]
+            put_sp[_PUT_TIME_OF_DAY] = get_sp[SZ_TIME_OF_DAY]
             put_switchpoints.append(put_sp)
 
-        put_day_schedule[pascal_case(SZ_SWITCHPOINTS)] = put_switchpoints
-        put_schedule[pascal_case(SZ_DAILY_SCHEDULES)].append(put_day_schedule)
+        put_day_schedule[_PUT_SWITCHPOINTS] = put_switchpoints
+        put_schedule[_PUT_DAILY_SCHEDULES].append(put_day_schedule)
 
     return put_schedule
 
@@ -170,19 +179,19 @@ def convert_to_get_schedule(schedule: _EvoDictT) -> _EvoDictT:
     get_schedule: dict[str, _EvoListT] = {}
     get_schedule[SZ_DAILY_SCHEDULES] = []
 
-    for put_day_schedule in schedule[pascal_case(SZ_DAILY_SCHEDULES)]:
-        day_of_week = put_day_schedule[pascal_case(SZ_DAY_OF_WEEK)]
+    for put_day_schedule in schedule[_PUT_DAILY_SCHEDULES]:
+        day_of_week = put_day_schedule[_PUT_DAY_OF_WEEK]
         get_day_schedule: _EvoDictT = {SZ_DAY_OF_WEEK: DAYS_OF_WEEK[day_of_week]}
         get_switchpoints: _EvoListT = []
 
-        for put_sp in put_day_schedule[pascal_case(SZ_SWITCHPOINTS)]:
+        for put_sp in put_day_schedule[_PUT_SWITCHPOINTS]:
             if SZ_HEAT_SETPOINT in put_sp:
                 # NOTE: this key is not converted to pascal_case in evohomeclient2
                 get_sp = {SZ_HEAT_SETPOINT: put_sp[SZ_HEAT_SETPOINT]}
             else:
-                get_sp = {SZ_DHW_STATE: put_sp[pascal_case(SZ_DHW_STATE)]}
+                get_sp = {SZ_DHW_STATE: put_sp[_PUT_DHW_STATE]}
 
-            get_sp[SZ_TIME_OF_DAY] = put_sp[pascal_case(SZ_TIME_OF_DAY)]
+            get_sp[SZ_TIME_OF_DAY] = put_sp[_PUT_TIME_OF_DAY]
             get_switchpoints.append(get_sp)
 
         get_day_schedule[SZ_SWITCHPOINTS] = get_switchpoints
@@ -46,13 +46,14 @@ from .const import (
     SystemMode,
     ZoneMode,
 )
+from .helpers import fullmatch, one_of
 
 # HACK: "2023-05-04T18:47:36.7727046" (7, not 6 digits) seen with gateway fault
 _DTM_FORMAT = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{1,7}$"
 
 SCH_ACTIVE_FAULT = vol.Schema(
     {
-        vol.Required(SZ_FAULT_TYPE): vol.In([m.value for m in FaultType]),
+        vol.Required(SZ_FAULT_TYPE): one_of(*(m.value for m in FaultType)),
         vol.Required(SZ_SINCE): vol.Any(
             vol.Datetime(format="%Y-%m-%dT%H:%M:%S"),  # faults for zones
             vol.Datetime(format="%Y-%m-%dT%H:%M:%S.%f"),
@@ -77,7 +78,7 @@ SCH_TEMPERATURE_STATUS = vol.Any(
 SCH_SETPOINT_STATUS = vol.Schema(
     {
         vol.Required(SZ_TARGET_HEAT_TEMPERATURE): float,
-        vol.Required(SZ_SETPOINT_MODE): vol.In([m.value for m in ZoneMode]),
+        vol.Required(SZ_SETPOINT_MODE): one_of(*(m.value for m in ZoneMode)),
         vol.Optional(SZ_UNTIL): vol.Datetime(format="%Y-%m-%dT%H:%M:%SZ"),
     },
     extra=vol.PREVENT_EXTRA,
@@ -85,7 +86,7 @@ SCH_SETPOINT_STATUS = vol.Schema(
 
 SCH_FAN_STATUS = vol.Schema(
     {
-        vol.Required(SZ_FAN_MODE): vol.In([m.value for m in FanMode]),
+        vol.Required(SZ_FAN_MODE): one_of(*(m.value for m in FanMode)),
         vol.Required(SZ_CAN_BE_CHANGED): bool,
     },
     extra=vol.PREVENT_EXTRA,
@@ -93,7 +94,7 @@ SCH_FAN_STATUS = vol.Schema(
 
 SCH_ZONE = vol.Schema(
     {
-        vol.Required(SZ_ZONE_ID): vol.Match(REGEX_ZONE_ID),
+        vol.Required(SZ_ZONE_ID): fullmatch(REGEX_ZONE_ID),
         vol.Required(SZ_NAME): str,
         vol.Required(SZ_TEMPERATURE_STATUS): SCH_TEMPERATURE_STATUS,
         vol.Required(SZ_SETPOINT_STATUS): SCH_SETPOINT_STATUS,
@@ -105,8 +106,8 @@ SCH_ZONE = vol.Schema(
 
 SCH_STATE_STATUS = vol.Schema(
     {
-        vol.Required(SZ_STATE): vol.In([m.value for m in DhwState]),
-        vol.Required(SZ_MODE): vol.In([m.value for m in ZoneMode]),
+        vol.Required(SZ_STATE): one_of(*(m.value for m in DhwState)),
+        vol.Required(SZ_MODE): one_of(*(m.value for m in ZoneMode)),
         vol.Optional(SZ_UNTIL): vol.Datetime(format="%Y-%m-%dT%H:%M:%SZ"),
     },
     extra=vol.PREVENT_EXTRA,
@@ -114,7 +115,7 @@ SCH_STATE_STATUS = vol.Schema(
 
 SCH_DHW = vol.Schema(
     {
-        vol.Required(SZ_DHW_ID): vol.Match(REGEX_DHW_ID),
+        vol.Required(SZ_DHW_ID): fullmatch(REGEX_DHW_ID),
         vol.Required(SZ_TEMPERATURE_STATUS): SCH_TEMPERATURE_STATUS,
         vol.Required(SZ_STATE_STATUS): SCH_STATE_STATUS,
         vol.Required(SZ_ACTIVE_FAULTS): [SCH_ACTIVE_FAULT],
@@ -126,13 +127,13 @@ SCH_DHW = vol.Schema(
 SCH_SYSTEM_MODE_STATUS = vol.Any(
     vol.Schema(
         {
-            vol.Required(SZ_MODE): vol.In([m.value for m in SystemMode]),
+            vol.Required(SZ_MODE): one_of(*(m.value for m in SystemMode)),
             vol.Required(SZ_IS_PERMANENT): True,
         }
     ),
     vol.Schema(
         {
-            vol.Required(SZ_MODE): vol.Any(
+            vol.Required(SZ_MODE): one_of(
                 str(SystemMode.AUTO_WITH_ECO),
                 str(SystemMode.AWAY),
                 str(SystemMode.CUSTOM),
@@ -147,7 +148,7 @@ SCH_SYSTEM_MODE_STATUS = vol.Any(
 
 SCH_TEMPERATURE_CONTROL_SYSTEM = vol.Schema(
     {
-        vol.Required(SZ_SYSTEM_ID): vol.Match(REGEX_SYSTEM_ID),
+        vol.Required(SZ_SYSTEM_ID): fullmatch(REGEX_SYSTEM_ID),
         vol.Required(SZ_SYSTEM_MODE_STATUS): SCH_SYSTEM_MODE_STATUS,
         vol.Required(SZ_ZONES): [SCH_ZONE],
         vol.Optional(SZ_DHW): SCH_DHW,
@@ -158,7 +159,7 @@ SCH_TEMPERATURE_CONTROL_SYSTEM = vol.Schema(
 
 SCH_GATEWAY = vol.Schema(
     {
-        vol.Required(SZ_GATEWAY_ID): vol.Match(REGEX_GATEWAY_ID),
+        vol.Required(SZ_GATEWAY_ID): fullmatch(REGEX_GATEWAY_ID),
         vol.Required(SZ_TEMPERATURE_CONTROL_SYSTEMS): [SCH_TEMPERATURE_CONTROL_SYSTEM],
         vol.Required(SZ_ACTIVE_FAULTS): [SCH_ACTIVE_FAULT],
     },
@@ -168,7 +169,7 @@ SCH_GATEWAY = vol.Schema(
 # location/{location_id}/status?includeTemperatureControlSystems=True
 SCH_LOCATION_STATUS = vol.Schema(
     {
-        vol.Required(SZ_LOCATION_ID): vol.Match(REGEX_LOCATION_ID),
+        vol.Required(SZ_LOCATION_ID): fullmatch(REGEX_LOCATION_ID),
         vol.Required(SZ_GATEWAYS): [SCH_GATEWAY],
     },
     extra=vol.PREVENT_EXTRA,
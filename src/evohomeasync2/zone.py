@@ -8,15 +8,17 @@
 
 from __future__ import annotations
 
-import json
+from copy import deepcopy
 from datetime import datetime as dt, timedelta as td
 from http import HTTPStatus
+from time import monotonic
 from typing import TYPE_CHECKING, Final, NoReturn
 
 import voluptuous as vol
 
 from . import exceptions as exc
 from .const import API_STRFTIME, ZoneMode
+from .helpers import json_dumps, json_loads
 from .schema import SCH_ZONE_STATUS
 from .schema.const import (
     SZ_ACTIVE_FAULTS,
@@ -60,11 +62,14 @@ if TYPE_CHECKING:
 
 
 _ONE_DAY = td(days=1)
+_SCHEDULE_TTL = 5 * 60  # seconds a retrieved schedule is considered current
 
 
 class ActiveFaultsBase:
     TYPE: _DhwIdT | _ZoneIdT  # "temperatureZone", "domesticHotWater"
 
+    __slots__ = ("_id", "_broker", "_logger", "_active_faults", "_last_logged")
+
     def __init__(
         self, id: _DhwIdT | _ZoneIdT, broker: Broker, logger: logging.Logger
     ) -> None:
@@ -123,6 +128,8 @@ class ActiveFaultsBase:
 class _ZoneBaseDeprecated:
     """Deprecated attributes and methods removed from the evohome-client namespace."""
 
+    __slots__ = ()
+
     @property
     def zone_type(self) -> NoReturn:
         raise exc.DeprecationError(f"{self}: .zone_type is deprecated, use .TYPE")
@@ -141,6 +148,8 @@ class _ZoneBase(ActiveFaultsBase, _ZoneBaseDeprecated):
     SCH_SCHEDULE_GET: Final[vol.Schema]  # type: ignore[misc]
     SCH_SCHEDULE_PUT: Final[vol.Schema]  # type: ignore[misc]
 
+    __slots__ = ("tcs", "_config", "_schedule", "_schedule_expires", "_status")
+
     def __init__(self, id: str, tcs: ControlSystem, config: _EvoDictT) -> None:
         super().__init__(id, tcs._broker, tcs._logger)
 
@@ -148,6 +157,7 @@ class _ZoneBase(ActiveFaultsBase, _ZoneBaseDeprecated):
 
         self._config: Final[_EvoDictT] = config
         self._schedule: _EvoDictT = {}
+        self._schedule_expires: float | None = None  # a time.monotonic() value
         self._status: _EvoDictT = {}
 
     async def _refresh_status(self) -> _EvoDictT:
@@ -185,8 +195,18 @@ class _ZoneBase(ActiveFaultsBase, _ZoneBaseDeprecated):
         ret: float = self.temperatureStatus[SZ_TEMPERATURE]
         return ret
 
-    async def get_schedule(self) -> _EvoDictT:
-        """Get the schedule for this DHW/zone object."""
+    async def get_schedule(self, force_update: bool = False) -> _EvoDictT:
+        """Get the schedule for this DHW/zone object.
+
+        A recently retrieved schedule is returned from the cache, unless forced.
+        """
+
+        if (
+            not force_update
+            and self._schedule_expires
+            and monotonic() < self._schedule_expires
+        ):
+            return deepcopy(self._schedule)  # the caller may mutate its copy
 
         self._logger.debug(f"{self}: Getting schedule...")
 
@@ -208,23 +228,29 @@ class _ZoneBase(ActiveFaultsBase, _ZoneBaseDeprecated):
             ) from err
 
         self._schedule = convert_to_put_schedule(schedule)
-        return self._schedule
+        self._schedule_expires = monotonic() + _SCHEDULE_TTL
+        return deepcopy(self._schedule)
 
-    async def set_schedule(self, schedule: _EvoDictT | str) -> None:
-        """Set the schedule for this DHW/zone object."""
+    async def set_schedule(self, schedule: _EvoDictT | bytes | str) -> None:
+        """Set the schedule for this DHW/zone object (as a dict, or as JSON)."""
 
         self._logger.debug(f"{self}: Setting schedule...")
 
-        if isinstance(schedule, dict):
+        self._schedule_expires = None  # the vendor may not store it exactly as sent
+
+        body: bytes | str  # the schedule as JSON, serialized only once
+
+        if isinstance(schedule, bytes | str):
+            body = schedule
             try:
-                json.dumps(schedule)
-            except (OverflowError, TypeError, ValueError) as err:
+                schedule = json_loads(schedule)
+            except ValueError as err:  # incl. JSONDecodeError, UnicodeDecodeError
                 raise exc.InvalidSchedule(f"{self}: Invalid schedule: {err}") from err
 
-        elif isinstance(schedule, str):
+        elif isinstance(schedule, dict):
             try:
-                schedule = json.loads(schedule)
-            except json.JSONDecodeError as err:
+                body = json_dumps(schedule)
+            except (OverflowError, TypeError, ValueError) as err:
                 raise exc.InvalidSchedule(f"{self}: Invalid schedule: {err}") from err
 
         else:
@@ -238,6 +264,7 @@ class _ZoneBase(ActiveFaultsBase, _ZoneBaseDeprecated):
             f"{self.TYPE}/{self._id}/schedule",
             json=schedule,
             schema=self.SCH_SCHEDULE_PUT,
+            data=body,
         )
 
         self._schedule = schedule
@@ -246,6 +273,8 @@ class _ZoneBase(ActiveFaultsBase, _ZoneBaseDeprecated):
 class _ZoneDeprecated:
     """Deprecated attributes and methods removed from the evohome-client namespace."""
 
+    __slots__ = ()
+
     async def cancel_temp_override(self) -> None:
         raise exc.DeprecationError(
             f"{self}: .cancel_temp_override() is deprecrated, use .reset_mode()"
@@ -261,6 +290,8 @@ class Zone(_ZoneDeprecated, _ZoneBase):
     SCH_SCHEDULE_GET: Final = SCH_GET_SCHEDULE_ZONE  # type: ignore[misc]
     SCH_SCHEDULE_PUT: Final = SCH_PUT_SCHEDULE_ZONE  # type: ignore[misc]
 
+    __slots__ = ()
+
     def __init__(self, tcs: ControlSystem, config: _EvoDictT) -> None:
         super().__init__(config[SZ_ZONE_ID], tcs, config)
 
@@ -6,7 +6,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-# import pytest
+import pytest
+import voluptuous as vol
+
+from evohomeasync2.schema.const import REGEX_ZONE_ID
+from evohomeasync2.schema.helpers import fullmatch, one_of
 from evohomeasync2.schema.schedule import (
     SCH_GET_SCHEDULE_ZONE,
     SCH_PUT_SCHEDULE_ZONE,
@@ -41,3 +45,27 @@ def test_schedule_to_pascal_case() -> None:
     assert put_schedule == SCH_PUT_SCHEDULE_ZONE(put_schedule)
 
     assert get_schedule == convert_to_get_schedule(put_schedule)
+
+
+def test_fullmatch() -> None:
+    """Validate an id against its regex, anchored at both ends."""
+
+    validator = fullmatch(REGEX_ZONE_ID)
+
+    assert validator("3432576") == "3432576"
+
+    for value in ("3432576x", "REDACTED", 3432576):
+        with pytest.raises(vol.Invalid):
+            validator(value)
+
+
+def test_one_of() -> None:
+    """Validate a value against a set of strings."""
+
+    validator = one_of("On", "Off")
+
+    assert validator("On") == "On"
+
+    for value in ("on", None, {"On": None}):
+        with pytest.raises(vol.Invalid):
+            validator(value)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Tests for evohome-async - validate the v1 client against a local web server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from http import HTTPMethod
+from pathlib import Path
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import evohomeasync as evo1
+import evohomeasync.broker
+
+from .helpers import TEST_DIR
+
+WORK_DIR = Path(f"{TEST_DIR}/v1_api")
+
+with open(WORK_DIR.joinpath("user_data.json")) as f:
+    USER_DATA = json.load(f)
+
+with open(WORK_DIR.joinpath("full_data.json")) as f:
+    FULL_DATA = json.load(f)
+
+ERRORS = web.AppKey("errors", list[int])  # statuses for the next GETs to fail with
+REQUESTS = web.AppKey("requests", list[str])  # a log of requests received
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncGenerator[TestServer, None]:
+    """Return a web server that mimics the v1 API (and logs each request)."""
+
+    async def session(request: web.Request) -> web.Response:
+        request.app[REQUESTS].append(f"{request.method} {request.path}")
+        return web.json_response(USER_DATA)
+
+    async def locations(request: web.Request) -> web.Response:
+        request.app[REQUESTS].append(f"{request.method} {request.path}")
+
+        if request.app[ERRORS]:  # e.g. respond with a transient error
+            return web.Response(status=request.app[ERRORS].pop(0))
+
+        await asyncio.sleep(0.01)  # so that requests can overlap
+        return web.json_response(FULL_DATA)
+
+    app = web.Application()
+    app[REQUESTS] = []
+    app[ERRORS] = []
+
+    app.router.add_post("/WebAPI/api/session", session)
+    app.router.add_get("/WebAPI/api/locations", locations)
+
+    server = TestServer(app)
+    await server.start_server()
+
+    try:
+        yield server
+    finally:
+        await server.close()
+
+
+def instantiate_client(server: TestServer, **kwargs) -> evo1.EvohomeClient:  # type: ignore[no-untyped-def]
+    return evo1.EvohomeClient(
+        "username", "password", hostname=str(server.make_url("")), **kwargs
+    )
+
+
+async def test_coalesced_refresh(server: TestServer) -> None:
+    """Concurrent refreshes of the location data share a single GET."""
+
+    async with instantiate_client(server) as evo:
+        await evo._populate_user_data()
+        await asyncio.gather(*(evo.get_temperatures() for _ in range(3)))
+
+    assert server.app[REQUESTS] == [
+        "POST /WebAPI/api/session",
+        "GET /WebAPI/api/locations",
+    ]
+
+
+async def test_retried_get(server: TestServer, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A GET is retried after a transient error (e.g. a 503)."""
+
+    monkeypatch.setattr(evohomeasync.broker, "_RETRY_DELAY", 0)
+    server.app[ERRORS].append(503)
+
+    async with instantiate_client(server) as evo:
+        assert await evo._populate_locn_data() == FULL_DATA[0]
+
+    assert server.app[REQUESTS] == [
+        "POST /WebAPI/api/session",
+        "GET /WebAPI/api/locations",
+        "GET /WebAPI/api/locations",
+    ]
+
+
+async def test_provided_session_id(server: TestServer) -> None:
+    """A client with a session ID (& its user ID) doesn't need to authenticate."""
+
+    async with instantiate_client(
+        server,
+        session_id=USER_DATA["sessionId"],
+        user_id=USER_DATA["userInfo"]["userID"],
+    ) as evo:
+        assert await evo._populate_locn_data() == FULL_DATA[0]
+
+    assert server.app[REQUESTS] == ["GET /WebAPI/api/locations"]
+
+
+@pytest.mark.parametrize(
+    ("error", "attempts"),
+    [
+        (aiohttp.ClientConnectionError("connection reset"), 3),  # is transient
+        (aiohttp.InvalidURL("bad URL"), 1),  # isn't transient, so not retried
+    ],
+)
+async def test_retried_errors(
+    monkeypatch: pytest.MonkeyPatch, error: aiohttp.ClientError, attempts: int
+) -> None:
+    """A GET is retried only after a transient error (e.g. a connection error)."""
+
+    calls: list[str] = []
+
+    async def _make_request(method: str, url: str, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        calls.append(url)
+        raise error
+
+    monkeypatch.setattr(evohomeasync.broker, "_RETRY_DELAY", 0)
+
+    async with evo1.EvohomeClient("username", "password") as evo:
+        monkeypatch.setattr(evo.broker, "_make_request", _make_request)
+
+        with pytest.raises(evo1.RequestFailed):
+            await evo.broker.make_request(HTTPMethod.GET, "locations")
+
+    assert len(calls) == attempts
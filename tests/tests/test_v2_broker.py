@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Tests for evohome-async - validate the (memoized, concurrent) GETs of the v2 broker."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from copy import deepcopy
+from datetime import datetime as dt, timedelta as td
+from typing import Any
+
+import pytest
+import voluptuous as vol
+
+import evohomeasync2 as evo2
+from evohomeasync2.broker import Broker
+from evohomeasync2.const import URL_BASE
+
+
+class _Response:
+    content_length = 0  # i.e. no body
+    status = 200
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _Session:
+    """A session that counts how many of its requests are in flight at once."""
+
+    def __init__(self) -> None:
+        self.in_flight = self.max_in_flight = 0
+
+    @asynccontextmanager
+    async def get(self, url: str, **kwargs: Any) -> AsyncIterator[_Response]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            yield _Response()
+        finally:
+            self.in_flight -= 1
+
+
+class _Schema(vol.Schema):  # type: ignore[misc]
+    """A schema that counts how often it is used to validate."""
+
+    calls = 0
+
+    def __call__(self, data: Any) -> Any:
+        self.calls += 1
+        return super().__call__(data)
+
+
+@pytest.fixture
+def responses() -> dict[str, Any]:
+    """Return the (mutable) responses of the broker, by URL."""
+    return {}
+
+
+@pytest.fixture
+def broker(monkeypatch: pytest.MonkeyPatch, responses: dict[str, Any]) -> Broker:
+    """Return a broker that 'GETs' a (freshly decoded) copy of its responses."""
+
+    broker = Broker("username", "password", logging.getLogger(__name__))
+
+    async def _client(method: str, url: str, **kwargs: Any) -> tuple[_Response, Any]:
+        return _Response(), deepcopy(responses[url.removeprefix(f"{URL_BASE}/")])
+
+    monkeypatch.setattr(broker, "_client", _client)
+    return broker
+
+
+async def test_get_memoized(broker: Broker, responses: dict[str, Any]) -> None:
+    """An unchanged response is validated only once, and each caller gets a copy."""
+
+    schema = _Schema({"name": str, "zones": [int]})
+    responses[url := "location/config"] = {"name": "home", "zones": [1]}
+
+    result = await broker.get(url, schema=schema, memoize=True)
+    result["zones"].append(2)  # the caller may mutate its copy
+
+    assert await broker.get(url, schema=schema, memoize=True) == {
+        "name": "home",
+        "zones": [1],
+    }
+    assert schema.calls == 1
+
+    responses[url]["zones"] = [1, 3]  # the config has changed
+    assert (await broker.get(url, schema=schema, memoize=True))["zones"] == [1, 3]
+    assert schema.calls == 2
+
+
+async def test_get_not_memoized(broker: Broker, responses: dict[str, Any]) -> None:
+    """By default, every response is validated."""
+
+    schema = _Schema({"temperature": float})
+    responses[url := "location/status"] = {"temperature": 19.5}
+
+    for _ in range(2):
+        assert await broker.get(url, schema=schema) == {"temperature": 19.5}
+
+    assert schema.calls == 2
+    assert not broker._validated
+
+
+async def test_get_concurrency() -> None:
+    """No more than max_concurrency requests are in flight at any one time."""
+
+    session = _Session()
+    broker = Broker(
+        "username",
+        "password",
+        logging.getLogger(__name__),
+        access_token="access_token",
+        access_token_expires=dt.now() + td(hours=1),
+        session=session,  # type: ignore[arg-type]
+        max_concurrency=2,
+    )
+
+    await asyncio.gather(*(broker.get(f"zone/{i}/schedule") for i in range(6)))
+    assert session.max_in_flight == 2
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_invalid_max_concurrency(max_concurrency: int) -> None:
+    """A max_concurrency of less than 1 is rejected."""
+
+    with pytest.raises(evo2.InvalidParameter):
+        evo2.EvohomeClient("username", "password", max_concurrency=max_concurrency)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Tests for evohome-async - validate the (private) helpers of the control system."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+import evohomeasync2 as evo2
+import evohomeasync2.controlsystem
+from evohomeasync2.controlsystem import (
+    _dumps,
+    _dumps_schedules,
+    _gather,
+    _loads_schedules,
+)
+
+from .helpers import TEST_DIR
+
+WORK_DIR = Path(f"{TEST_DIR}/schedules")
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Serialize the schedules with orjson (if installed), and with the fallback."""
+
+    if request.param == "json":
+        monkeypatch.setattr(evohomeasync2.controlsystem, "orjson", None)
+    elif evohomeasync2.controlsystem.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param  # type: ignore[no-any-return]
+
+
+def _schedules() -> dict:
+    with open(WORK_DIR.joinpath("schedule_dhw_put.json")) as f:
+        dhw_schedule = json.load(f)
+    with open(WORK_DIR.joinpath("schedule_zone_put.json")) as f:
+        zone_schedule = json.load(f)
+
+    return {
+        "3933910": {"name": "Ønske", "schedule": dhw_schedule},  # NB: not ASCII
+        "3432521": {"name": "Kitchen", "schedule": zone_schedule},
+    }
+
+
+async def test_gather() -> None:
+    """If one coroutine fails, the others are cancelled and its exception raised."""
+
+    cancelled: set[int] = set()
+
+    async def put(idx: int) -> int:
+        try:
+            await asyncio.sleep(0.01 * idx)
+        except asyncio.CancelledError:
+            cancelled.add(idx)
+            raise
+        if idx == 1:
+            raise evo2.RequestFailed("PUT failed")
+        return idx
+
+    assert await _gather(*(put(i) for i in (0, 0))) == [0, 0]
+
+    with pytest.raises(evo2.RequestFailed):
+        await _gather(*(put(i) for i in range(4)))
+
+    assert cancelled == {2, 3}  # the (slower) siblings of the failed PUT
+
+
+@pytest.mark.parametrize("count", [0, 1, 2])
+def test_dumps_schedules(serializer: str, count: int) -> None:
+    """The chunks of a backup are the same as a one-shot dump, and round trip."""
+
+    schedules = dict(list(_schedules().items())[:count])
+
+    data = b"".join(_dumps_schedules(schedules))
+
+    assert data == _dumps(schedules)
+    assert _loads_schedules(data) == schedules
@@ -35,6 +35,7 @@ _LOGGER = logging.getLogger(__name__)
 
 
 _global_session_id: str | None = None  # session_id
+_global_user_id: int | None = None  # user_id, needed to use the session_id
 
 
 async def instantiate_client_v1(
@@ -44,7 +45,7 @@ async def instantiate_client_v1(
 ) -> evo1.EvohomeClient:
     """Instantiate a client, and logon to the vendor API."""
 
-    global _global_session_id
+    global _global_session_id, _global_user_id
 
     # Instantiation, NOTE: No API calls invoked during instantiation
     evo = evo1.EvohomeClient(
@@ -52,11 +53,13 @@ async def instantiate_client_v1(
         password,
         session=session,
         session_id=_global_session_id,
+        user_id=_global_user_id,
     )
 
     # Authentication
     await evo._populate_user_data()
     _global_session_id = evo.broker.session_id
+    _global_user_id = evo.broker.user_id
 
     return evo
 
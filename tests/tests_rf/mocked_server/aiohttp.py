@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 
 _DEFAULT_LIMIT = 2**16  # 64 KiB
 
+_json_loads = json.loads  # as json is a kwarg of ClientSession.put()
+
 
 @verify(EnumCheck.UNIQUE)
 class hdrs(StrEnum):  # a la aiohttp
@@ -94,6 +96,8 @@ class ClientSession:
     def put(
         self, url, /, *, data: Any = None, json: Any = None, headers: str | None = None
     ):
+        if isinstance(data, bytes | str):  # a pre-serialized JSON body
+            data = _json_loads(data)
         return ClientResponse(hdrs.METH_PUT, url, data=data or json, session=self)  # type: ignore[arg-type]
 
     def post(self, url, /, *, data: Any = None, headers: str | None = None):
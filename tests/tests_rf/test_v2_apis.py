@@ -8,6 +8,7 @@ from datetime import datetime as dt
 import pytest
 
 import evohomeasync2 as evo2
+from evohomeasync2.const import SZ_ID, SZ_SCHEDULE, SZ_THERMOSTAT
 from evohomeasync2.schema import (
     SCH_DHW_STATUS,
     SCH_FULL_CONFIG,
@@ -43,7 +44,8 @@ async def _test_basics_apis(evo: evo2.EvohomeClient) -> None:
     access_token = evo.access_token
     refresh_token = evo.refresh_token
 
-    await evo.broker._headers()
+    headers = await evo.broker._headers()
+    assert await evo.broker._headers() is headers  # built once per access_token
 
     # The above should not cause a re-authentication, so...
     assert evo.access_token == access_token
@@ -117,6 +119,8 @@ async def _test_sched__apis(evo: evo2.EvohomeClient) -> None:
     if (zone := evo._get_single_tcs()._zones[0]) and zone._id != mock.GHOST_ZONE_ID:
         schedule = await zone.get_schedule()
         assert SCH_PUT_SCHEDULE_ZONE(schedule)
+        assert (result := await zone.get_schedule()) == schedule  # from the cache
+        assert result is not schedule  # ...but a copy
         await zone.set_schedule(schedule)
 
     if zone := evo._get_single_tcs().zones_by_id.get(mock.GHOST_ZONE_ID):
@@ -127,6 +131,17 @@ async def _test_sched__apis(evo: evo2.EvohomeClient) -> None:
         else:
             assert False
 
+    #
+    # STEP 3: GET & PUT all schedules of the TCS (concurrently)
+    tcs = evo._get_single_tcs()
+
+    schedules = await tcs._get_schedules()
+    assert len(schedules) == len(tcs._zones) + (1 if tcs.hotwater else 0)
+
+    assert await tcs._set_schedules(
+        {k: v for k, v in schedules.items() if v[SZ_SCHEDULE]}
+    )
+
 
 async def _test_status_apis(evo: evo2.EvohomeClient) -> None:
     """Test `_refresh_status()` for DHW/zone."""
@@ -146,7 +161,15 @@ async def _test_status_apis(evo: evo2.EvohomeClient) -> None:
         zone_status = await zone._refresh_status()
         assert SCH_ZONE_STATUS(zone_status)
 
-    pass
+    #
+    # STEP 3: GET /location/{locationId}/status, via the convenience function
+    tcs = evo._get_single_tcs()
+
+    temps = await tcs.temperatures()
+    assert len(temps) == len(tcs._zones) + (1 if tcs.hotwater else 0)
+    assert [t[SZ_ID] for t in temps if t[SZ_THERMOSTAT] == "EMEA_ZONE"] == [
+        z.zoneId for z in tcs._zones
+    ]
 
 
 async def _test_system_apis(evo: evo2.EvohomeClient) -> None: